@@ -5,17 +5,69 @@ Handles communication with Ollama Cloud API for vision model inference
 using the OpenAI-compatible API format.
 """
 
-import base64
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from openai import OpenAI
-from PIL import Image
+import httpx
+import orjson
+import pybase64
 
 logger = logging.getLogger("OllamaVisionClient")
 
 
+class _OrjsonRequestMixin:
+    """
+    Serialize JSON request bodies with orjson instead of the stdlib encoder.
+
+    The OpenAI SDK hands request bodies to httpx as json=...; for image
+    requests that body carries a multi-MB base64 string, which orjson
+    encodes several times faster straight to bytes.
+    """
+
+    def build_request(self, *args, json=None, **kwargs):
+        if json is not None and not kwargs.get("files") and kwargs.get("content") is None:
+            try:
+                kwargs["content"] = orjson.dumps(json)
+                json = None
+                # httpx only adds this header itself for json= bodies
+                headers = httpx.Headers(kwargs.get("headers"))
+                headers.setdefault("Content-Type", "application/json")
+                kwargs["headers"] = headers
+            except TypeError:
+                # Leave anything orjson can't handle to httpx
+                pass
+        return super().build_request(*args, json=json, **kwargs)
+
+
+class _OrjsonClient(_OrjsonRequestMixin, httpx.Client):
+    pass
+
+
+class _OrjsonAsyncClient(_OrjsonRequestMixin, httpx.AsyncClient):
+    pass
+
+
+def _sniff_mime_type(header: bytes) -> Optional[str]:
+    """Detect image MIME type from the file's magic bytes"""
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if header.startswith(b'GIF8'):
+        return 'image/gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    if header.startswith(b'BM'):
+        return 'image/bmp'
+    return None
+
+
 class OllamaVisionClient:
     """Client for Ollama Cloud vision model API"""
 
@@ -29,13 +81,38 @@ class OllamaVisionClient:
         '.bmp': 'image/bmp',
     }
 
+    # Precomputed data URL prefixes per MIME type
+    MIME_PREFIXES = {
+        mime: f"data:{mime};base64,".encode('ascii')
+        for mime in set(SUPPORTED_FORMATS.values())
+    }
+
+    # Vision models downscale larger inputs server-side anyway
+    DEFAULT_RESIZE_MAX_DIM = 1568
+    RESIZE_JPEG_QUALITY = 88
+
+    # Maximum number of entries kept in the in-memory LRU caches. Encoded
+    # images are several MB each, so that cache is kept much smaller and
+    # also capped by total size: images that are not resized (in-memory
+    # bytes, RESIZE_MAX_DIM=0) can encode to tens of MB.
+    DESCRIPTION_CACHE_SIZE = 128
+    ENCODING_CACHE_SIZE = 16
+    ENCODING_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+    # Uploaded file_ids kept for reuse; each one is a file stored on the
+    # server, deleted again when it leaves this cache
+    FILE_ID_CACHE_SIZE = 32
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://ollama.com/v1",
         model: str = "qwen3-vl:235b-cloud",
         temperature: float = 0.2,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        strict_validation: bool = False,
+        resize_max_dim: int = DEFAULT_RESIZE_MAX_DIM,
+        native_upload: bool = False
     ):
         """
         Initialize Ollama Cloud vision client.
@@ -46,57 +123,437 @@ class OllamaVisionClient:
             model: Vision model to use (must have -cloud suffix)
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
+            strict_validation: Fully verify image structure with PIL instead
+                of only checking the file signature
+            resize_max_dim: Downscale images whose width or height exceeds
+                this many pixels before upload (0 disables resizing)
+            native_upload: Try uploading raw image bytes via the /files
+                endpoint and referencing them by file_id instead of sending
+                a base64 data URL. Falls back to base64 if either the upload
+                or the file_id reference is rejected. At most
+                FILE_ID_CACHE_SIZE uploads are kept on the server; older
+                ones, and the rest when the client is closed, are deleted.
         """
         self.api_key = api_key
         self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.strict_validation = strict_validation
+        self.resize_max_dim = resize_max_dim
+        self.native_upload = native_upload
+
+        # Cleared once the endpoint rejects a file upload or file_id
+        # reference, so later calls don't pay for a round trip that is
+        # known to fail
+        self._native_upload_available = native_upload
+
+        # LRU caches keyed by image content digest. The lock guards them
+        # when images are prepared on worker threads.
+        self._desc_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._encoding_cache: OrderedDict[tuple[str, bool], str] = OrderedDict()
+        self._file_id_cache: OrderedDict[tuple[str, bool], str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Pooled HTTP/2 transport with keep-alive so repeated calls reuse
+        # the same TCP + TLS session instead of reconnecting
+        self.http_client = _OrjsonClient(**self._http_client_options())
 
-        # Initialize OpenAI client for Ollama Cloud
+        # Initialize OpenAI client for Ollama Cloud. The SDK is imported
+        # lazily since it is slow to load and only needed once a client exists.
+        from openai import OpenAI
         self.client = OpenAI(
             api_key=api_key,
-            base_url=base_url
+            base_url=base_url,
+            http_client=self.http_client
         )
 
-        logger.info(f"Initialized Ollama Cloud client")
-        logger.info(f"Base URL: {base_url}")
-        logger.info(f"Model: {model}")
+        logger.info("Initialized Ollama Cloud client")
+        logger.info("Base URL: %s", base_url)
+        logger.info("Model: %s", model)
 
-    def _get_mime_type(self, file_path: Path) -> str:
-        """Determine MIME type from file extension"""
-        ext = file_path.suffix.lower()
-        return self.SUPPORTED_FORMATS.get(ext, 'image/jpeg')
+    def _validate_image(self, ext: str, data: bytes, strict: bool = False) -> None:
+        """
+        Validate that the file contents are a supported image format.
 
-    def _validate_image(self, file_path: Path) -> None:
-        """Validate that the file is a supported image format"""
-        ext = file_path.suffix.lower()
+        By default only the magic bytes are checked against the file
+        extension, which is O(1); the vision model rejects corrupted image
+        data anyway. With strict=True the whole image is verified with PIL.
+        """
         if ext not in self.SUPPORTED_FORMATS:
             raise ValueError(
                 f"Unsupported image format: {ext}. "
                 f"Supported formats: {', '.join(self.SUPPORTED_FORMATS.keys())}"
             )
 
-        # Try to open with PIL to verify it's a valid image
+        if _sniff_mime_type(data[:12]) != self.SUPPORTED_FORMATS[ext]:
+            raise ValueError(
+                f"Invalid or corrupted image file: contents do not match {ext} format"
+            )
+
+        if strict:
+            from PIL import Image
+
+            # Try to open with PIL to verify it's a valid image
+            try:
+                with Image.open(BytesIO(data)) as img:
+                    img.verify()
+            except Exception as e:
+                raise ValueError(f"Invalid or corrupted image file: {e}")
+
+    def _check_mime_type(self, mime_type: str) -> None:
+        """Validate that the MIME type is a supported image format"""
+        if mime_type not in self.MIME_PREFIXES:
+            raise ValueError(
+                f"Unsupported image MIME type: {mime_type}. "
+                f"Supported types: {', '.join(sorted(self.MIME_PREFIXES))}"
+            )
+
+    @staticmethod
+    def _http_client_options() -> dict:
+        """Connection pool settings shared by the sync and async transports"""
+        return {
+            "limits": httpx.Limits(
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0
+            ),
+            "http2": True,
+            "timeout": httpx.Timeout(60.0, connect=5.0),
+        }
+
+    def _cache_get(self, cache: OrderedDict, key: tuple) -> Optional[str]:
+        """Look up an LRU cache entry, marking it as most recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(
+        self,
+        cache: OrderedDict,
+        key: tuple,
+        value: str,
+        max_size: int,
+        max_bytes: Optional[int] = None
+    ) -> list[str]:
+        """
+        Store an LRU cache entry, evicting the oldest ones past max_size.
+
+        With max_bytes, the oldest entries are also evicted until the
+        values total at most that many characters, and a value larger
+        than max_bytes by itself is not cached at all.
+
+        Returns:
+            Values that dropped out of the cache: a replaced value for the
+            same key and any evicted entries
+        """
+        if max_bytes is not None and len(value) > max_bytes:
+            return []
+
+        with self._cache_lock:
+            previous = cache.get(key)
+            dropped = [previous] if previous is not None and previous != value else []
+            cache[key] = value
+            cache.move_to_end(key)
+            total = sum(map(len, cache.values())) if max_bytes is not None else 0
+            while len(cache) > max_size or (max_bytes is not None and total > max_bytes):
+                evicted = cache.popitem(last=False)[1]
+                total -= len(evicted)
+                dropped.append(evicted)
+            return dropped
+
+    def _resize_image(self, data: bytes) -> Optional[bytes]:
+        """
+        Downscale the image to fit within resize_max_dim, preserving aspect ratio.
+
+        Returns the re-encoded JPEG bytes, or None if no resize is needed.
+        """
+        from PIL import Image, ImageOps
+
+        max_dim = self.resize_max_dim
         try:
-            with Image.open(file_path) as img:
-                img.verify()
+            with Image.open(BytesIO(data)) as img:
+                # Image.open only parses the header, so images that already
+                # fit are returned untouched without decoding any pixels
+                if img.width <= max_dim and img.height <= max_dim:
+                    return None
+
+                original_size = img.size
+                # For JPEGs, let libjpeg decode straight at a reduced scale
+                # (1/2, 1/4, 1/8) that still covers the target; no-op otherwise
+                img.draft('RGB', (max_dim, max_dim))
+
+                # Re-encoding drops EXIF, so bake the Orientation tag into
+                # the pixels first or phone photos arrive sideways
+                oriented = ImageOps.exif_transpose(img)
+
+                # JPEG has no alpha channel: resize with alpha intact, then
+                # flatten onto white so transparent areas don't turn black
+                has_alpha = oriented.mode in ('RGBA', 'LA', 'PA') or (
+                    oriented.mode == 'P' and 'transparency' in oriented.info
+                )
+                resized = oriented.convert('RGBA' if has_alpha else 'RGB')
+                resized.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+                if has_alpha:
+                    background = Image.new('RGB', resized.size, (255, 255, 255))
+                    background.paste(resized, mask=resized.getchannel('A'))
+                    resized = background
+
+                output = BytesIO()
+                resized.save(output, format='JPEG', quality=self.RESIZE_JPEG_QUALITY)
         except Exception as e:
             raise ValueError(f"Invalid or corrupted image file: {e}")
 
-    def _encode_image(self, file_path: Path) -> str:
-        """Encode image to base64 string"""
+        resized_data = output.getvalue()
+        logger.info(
+            "Resized image from %dx%d to %dx%d (%d -> %d bytes)",
+            original_size[0], original_size[1], resized.width, resized.height,
+            len(data), len(resized_data)
+        )
+        return resized_data
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        """Content digest used as the cache key for an image"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _load_and_validate(self, image_path: Union[str, Path]) -> tuple[bytes, str, str]:
+        """
+        Read the image file once and validate it.
+
+        Returns:
+            Tuple of (file bytes, MIME type, content digest). The digest is
+            taken over the original file so cache lookups can happen before
+            any resizing.
+        """
+        file_path = Path(image_path)
         try:
-            with open(file_path, 'rb') as image_file:
-                encoded = base64.b64encode(image_file.read()).decode('utf-8')
-                logger.debug(f"Encoded image: {file_path.name} ({len(encoded)} bytes)")
-                return encoded
+            data = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Image file not found: {file_path}")
         except Exception as e:
             raise IOError(f"Failed to read image file: {e}")
 
+        ext = file_path.suffix.lower()
+        self._validate_image(ext, data, strict=self.strict_validation)
+        mime_type = self.SUPPORTED_FORMATS[ext]
+        return data, mime_type, self._digest(data)
+
+    def _prepare_upload(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        resize: bool
+    ) -> tuple[bytes, str]:
+        """Downscale the image if requested and oversized; returns (bytes, MIME type)"""
+        if resize and self.resize_max_dim > 0:
+            resized_data = self._resize_image(image_data)
+            if resized_data is not None:
+                return resized_data, 'image/jpeg'
+        return image_data, mime_type
+
+    def _get_data_url(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        digest: str,
+        resize: bool,
+        prepared: Optional[tuple[bytes, str]] = None
+    ) -> str:
+        """
+        Return the base64 data URL for the image, reusing cached encodings.
+
+        prepared is the _prepare_upload result if the caller already has
+        one, so an oversized image is not resized a second time.
+        """
+        encoding_key = (digest, resize)
+        data_url = self._cache_get(self._encoding_cache, encoding_key)
+        if data_url is None:
+            image_data, mime_type = prepared or self._prepare_upload(
+                image_data, mime_type, resize
+            )
+            # Encode image and build the data URL in a single ASCII decode.
+            # pybase64 dispatches to a SIMD codec.
+            base64_image = pybase64.b64encode(image_data)
+            logger.debug("Encoded image: %s (%d bytes)", mime_type, len(base64_image))
+            prefix = self.MIME_PREFIXES[mime_type]
+            data_url = (prefix + base64_image).decode('ascii')
+            self._cache_put(
+                self._encoding_cache, encoding_key, data_url,
+                self.ENCODING_CACHE_SIZE, self.ENCODING_CACHE_MAX_BYTES
+            )
+        return data_url
+
+    @staticmethod
+    def _upload_file_tuple(file_bytes: bytes, mime_type: str) -> tuple[str, bytes, str]:
+        """Build the (filename, content, content type) tuple for a file upload"""
+        return f"image.{mime_type.split('/')[1]}", file_bytes, mime_type
+
+    def _delete_files(self, file_ids: list[str]) -> None:
+        """Best-effort removal of uploaded files from the server"""
+        for file_id in file_ids:
+            try:
+                self.client.files.delete(file_id)
+            except Exception as e:
+                logger.warning("Failed to delete uploaded file %s: %s", file_id, e)
+
+    def _delete_uploaded_files(self) -> None:
+        """Forget all cached file_ids and delete the files behind them"""
+        with self._cache_lock:
+            file_ids = list(self._file_id_cache.values())
+            self._file_id_cache.clear()
+        self._delete_files(file_ids)
+
+    def _disable_native_upload(self, error: Exception) -> None:
+        """Remember that the endpoint has no usable file upload support"""
+        logger.info("Native image upload not supported, using base64: %s", error)
+        self._native_upload_available = False
+        self._delete_uploaded_files()
+
+    def _is_file_id_rejection(self, error: Exception, image_url: dict) -> bool:
+        """
+        Whether a chat call that referenced a file_id was rejected as invalid.
+
+        The 400/422 may be about something other than the image (prompt,
+        max_tokens, model), so callers retry with a data URL and only
+        disable native upload once that retry succeeds.
+        """
+        import openai
+
+        return "file_id" in image_url and isinstance(
+            error, (openai.BadRequestError, openai.UnprocessableEntityError)
+        )
+
+    def _try_native_upload(self, file_bytes: bytes, mime_type: str) -> Optional[str]:
+        """
+        Upload raw image bytes to the /files endpoint.
+
+        Returns:
+            The uploaded file_id, or None if the endpoint rejects uploads
+        """
+        import openai
+
+        try:
+            uploaded = self.client.files.create(
+                file=self._upload_file_tuple(file_bytes, mime_type),
+                purpose="vision"
+            )
+        except openai.APIStatusError as e:
+            self._disable_native_upload(e)
+            return None
+
+        return uploaded.id
+
+    def _get_image_url(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        digest: str,
+        resize: bool
+    ) -> tuple[dict, Optional[tuple[bytes, str]]]:
+        """
+        Return the image_url content for the image: a file_id or a data URL.
+
+        Returns:
+            Tuple of (image_url content, _prepare_upload result or None if
+            the image was not prepared). Passing the prepared bytes on lets
+            a base64 fallback skip resizing the image again.
+        """
+        prepared = None
+        if self._native_upload_available:
+            upload_key = (digest, resize)
+            file_id = self._cache_get(self._file_id_cache, upload_key)
+            if file_id is None:
+                prepared = self._prepare_upload(image_data, mime_type, resize)
+                file_id = self._try_native_upload(*prepared)
+                if file_id is not None:
+                    self._delete_files(self._cache_put(
+                        self._file_id_cache, upload_key, file_id, self.FILE_ID_CACHE_SIZE
+                    ))
+            if file_id is not None:
+                return {"file_id": file_id}, prepared
+
+        data_url = self._get_data_url(image_data, mime_type, digest, resize, prepared)
+        return {"url": data_url}, prepared
+
+    def _build_messages(self, user_prompt: str, image_url: dict) -> list[dict]:
+        """Build the chat messages payload for a single image request"""
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": user_prompt
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": image_url
+                    }
+                ]
+            }
+        ]
+
+    def _start_request(
+        self,
+        digest: str,
+        prompt: Optional[str]
+    ) -> tuple[str, tuple[str, str], Optional[str]]:
+        """
+        Resolve the prompt and description cache key for a request.
+
+        Returns:
+            Tuple of (user prompt, cache key, cached description or None)
+        """
+        # Default prompt
+        user_prompt = prompt or "Describe this image in detail."
+
+        # Identical image content + prompt: reuse the previous answer.
+        # Checked before any resizing so a hit costs no image work.
+        cache_key = (digest, prompt or "")
+        cached = self._cache_get(self._desc_cache, cache_key)
+        if cached is not None:
+            logger.info("Returning cached description")
+            return user_prompt, cache_key, cached
+
+        logger.info("Analyzing image with Ollama Cloud")
+        logger.info("Model: %s", self.model)
+        logger.info("Prompt: %s", user_prompt)
+        return user_prompt, cache_key, None
+
+    def _completion_params(self, user_prompt: str, image_url: dict) -> dict:
+        """Keyword arguments for chat.completions.create"""
+        return {
+            "model": self.model,
+            "messages": self._build_messages(user_prompt, image_url),
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        }
+
+    @staticmethod
+    def _api_error(error: Exception) -> RuntimeError:
+        """Log an API failure and wrap it in the RuntimeError callers expect"""
+        error_msg = f"Ollama Cloud API error: {str(error)}"
+        logger.error(error_msg)
+        return RuntimeError(error_msg)
+
+    def _handle_response(self, response, cache_key: tuple[str, str]) -> str:
+        """Extract the description from an API response and cache it"""
+        description = response.choices[0].message.content
+
+        if not description:
+            raise RuntimeError("Empty response from vision model")
+
+        logger.info("Successfully received description (%d chars)", len(description))
+        self._cache_put(
+            self._desc_cache, cache_key, description, self.DESCRIPTION_CACHE_SIZE
+        )
+        return description
+
     def describe_image(
         self,
-        image_path: str,
+        image_path: Union[str, Path],
         prompt: Optional[str] = None
     ) -> str:
         """
@@ -114,64 +571,81 @@ class OllamaVisionClient:
             ValueError: If image format is unsupported or invalid
             RuntimeError: If API call fails
         """
-        file_path = Path(image_path)
+        # Read and validate the image in a single pass over the file
+        image_data, mime_type, digest = self._load_and_validate(image_path)
+        return self._describe_image_data(
+            image_data, mime_type, digest, prompt, resize=True
+        )
 
-        # Validate file exists
-        if not file_path.exists():
-            raise FileNotFoundError(f"Image file not found: {image_path}")
+    def describe_image_bytes(
+        self,
+        image_bytes: bytes,
+        mime_type: str,
+        prompt: Optional[str] = None
+    ) -> str:
+        """
+        Describe an in-memory image using the vision model.
 
-        # Validate image format
-        self._validate_image(file_path)
+        The bytes are sent as-is, without the format validation and
+        resizing that describe_image applies to files.
 
-        # Encode image
-        base64_image = self._encode_image(file_path)
-        mime_type = self._get_mime_type(file_path)
+        Args:
+            image_bytes: Encoded image data
+            mime_type: MIME type of image_bytes, e.g. "image/png"
+            prompt: Optional custom prompt. Defaults to "Describe this image in detail."
 
-        # Default prompt
-        user_prompt = prompt or "Describe this image in detail."
+        Returns:
+            Description of the image
 
-        logger.info(f"Analyzing image with Ollama Cloud")
-        logger.info(f"Model: {self.model}")
-        logger.info(f"Prompt: {user_prompt}")
+        Raises:
+            ValueError: If the MIME type is unsupported
+            RuntimeError: If API call fails
+        """
+        self._check_mime_type(mime_type)
+        return self._describe_image_data(
+            image_bytes, mime_type, self._digest(image_bytes), prompt, resize=False
+        )
+
+    def _describe_image_data(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        digest: str,
+        prompt: Optional[str],
+        resize: bool
+    ) -> str:
+        """Answer from the description cache or call the vision model"""
+        user_prompt, cache_key, cached = self._start_request(digest, prompt)
+        if cached is not None:
+            return cached
 
         try:
-            # Call Ollama Cloud API (OpenAI-compatible)
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": user_prompt
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:{mime_type};base64,{base64_image}"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+            image_url, prepared = self._get_image_url(
+                image_data, mime_type, digest, resize
             )
 
-            # Extract description from response
-            description = response.choices[0].message.content
-
-            if not description:
-                raise RuntimeError("Empty response from vision model")
-
-            logger.info(f"Successfully received description ({len(description)} chars)")
-            return description
+            # Call Ollama Cloud API (OpenAI-compatible)
+            try:
+                response = self.client.chat.completions.create(
+                    **self._completion_params(user_prompt, image_url)
+                )
+            except Exception as e:
+                if not self._is_file_id_rejection(e, image_url):
+                    raise
+                data_url = self._get_data_url(
+                    image_data, mime_type, digest, resize, prepared
+                )
+                image_url = {"url": data_url}
+                response = self.client.chat.completions.create(
+                    **self._completion_params(user_prompt, image_url)
+                )
+                # The same request went through with base64, so it was the
+                # file_id reference that the endpoint rejected
+                self._disable_native_upload(e)
+            return self._handle_response(response, cache_key)
 
         except Exception as e:
-            error_msg = f"Ollama Cloud API error: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
+            raise self._api_error(e) from e
 
     def check_connection(self) -> tuple[bool, str]:
         """
@@ -189,3 +663,157 @@ class OllamaVisionClient:
             error_msg = f"Cannot connect to Ollama Cloud: {e}"
             logger.error(error_msg)
             return False, error_msg
+
+    def close(self) -> None:
+        """Delete uploaded files and close the underlying HTTP connection pool"""
+        self._delete_uploaded_files()
+        self.client.close()
+
+
+class AsyncOllamaVisionClient(OllamaVisionClient):
+    """
+    Ollama Cloud vision client with an asyncio interface.
+
+    Model calls go through AsyncOpenAI so many image requests can be in
+    flight at once; file I/O and base64 encoding run on worker threads to
+    keep the event loop responsive. The synchronous API stays available.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        from openai import AsyncOpenAI
+
+        self.async_http_client = _OrjsonAsyncClient(**self._http_client_options())
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.base_url,
+            http_client=self.async_http_client
+        )
+
+    async def describe_image_async(
+        self,
+        image_path: Union[str, Path],
+        prompt: Optional[str] = None
+    ) -> str:
+        """
+        Describe an image using the vision model without blocking the event loop.
+
+        Args:
+            image_path: Path to the image file
+            prompt: Optional custom prompt. Defaults to "Describe this image in detail."
+
+        Returns:
+            Description of the image
+
+        Raises:
+            FileNotFoundError: If image file doesn't exist
+            ValueError: If image format is unsupported or invalid
+            RuntimeError: If API call fails
+        """
+        # Read and validate the image off the event loop
+        image_data, mime_type, digest = await asyncio.to_thread(
+            self._load_and_validate, image_path
+        )
+        return await self._describe_image_data_async(
+            image_data, mime_type, digest, prompt, resize=True
+        )
+
+    async def describe_image_bytes_async(
+        self,
+        image_bytes: bytes,
+        mime_type: str,
+        prompt: Optional[str] = None
+    ) -> str:
+        """
+        Describe an in-memory image without blocking the event loop.
+
+        The bytes are sent as-is, without the format validation and
+        resizing that describe_image_async applies to files.
+
+        Args:
+            image_bytes: Encoded image data
+            mime_type: MIME type of image_bytes, e.g. "image/png"
+            prompt: Optional custom prompt. Defaults to "Describe this image in detail."
+
+        Returns:
+            Description of the image
+
+        Raises:
+            ValueError: If the MIME type is unsupported
+            RuntimeError: If API call fails
+        """
+        self._check_mime_type(mime_type)
+
+        # Hashing a multi-MB image would stall the event loop
+        digest = await asyncio.to_thread(self._digest, image_bytes)
+        return await self._describe_image_data_async(
+            image_bytes, mime_type, digest, prompt, resize=False
+        )
+
+    async def _describe_image_data_async(
+        self,
+        image_data: bytes,
+        mime_type: str,
+        digest: str,
+        prompt: Optional[str],
+        resize: bool
+    ) -> str:
+        """Async variant of _describe_image_data"""
+        user_prompt, cache_key, cached = self._start_request(digest, prompt)
+        if cached is not None:
+            return cached
+
+        try:
+            # Resizing, encoding and any file upload run on a worker thread
+            image_url, prepared = await asyncio.to_thread(
+                self._get_image_url, image_data, mime_type, digest, resize
+            )
+
+            # Call Ollama Cloud API (OpenAI-compatible)
+            try:
+                response = await self.async_client.chat.completions.create(
+                    **self._completion_params(user_prompt, image_url)
+                )
+            except Exception as e:
+                if not self._is_file_id_rejection(e, image_url):
+                    raise
+                data_url = await asyncio.to_thread(
+                    self._get_data_url, image_data, mime_type, digest, resize, prepared
+                )
+                image_url = {"url": data_url}
+                response = await self.async_client.chat.completions.create(
+                    **self._completion_params(user_prompt, image_url)
+                )
+                # Deleting the uploaded files makes blocking HTTP calls
+                await asyncio.to_thread(self._disable_native_upload, e)
+            return self._handle_response(response, cache_key)
+
+        except Exception as e:
+            raise self._api_error(e) from e
+
+    async def check_connection_async(self) -> tuple[bool, str]:
+        """
+        Check if Ollama Cloud is accessible over the async connection pool.
+
+        Besides reporting reachability, this opens (and keeps alive) the
+        connection that subsequent describe_image_async calls reuse.
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            # Try to list models as a connection test
+            await self.async_client.models.list()
+            logger.info("Successfully connected to Ollama Cloud")
+            return True, f"Connected to {self.base_url}"
+        except Exception as e:
+            error_msg = f"Cannot connect to Ollama Cloud: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    async def aclose(self) -> None:
+        """Close both the async and sync HTTP connection pools"""
+        await self.async_client.close()
+        # Uploaded-file cleanup makes blocking HTTP calls
+        await asyncio.to_thread(self.close)
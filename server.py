@@ -6,14 +6,16 @@ Provides image description capabilities using Qwen3-VL vision model
 through Ollama Cloud integration.
 """
 
+import asyncio
 import logging
 import os
+import stat
 from typing import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from mcp.server.fastmcp import FastMCP
-from ollama_vision_client import OllamaVisionClient
+from mcp.server.fastmcp import Context, FastMCP
+from ollama_vision_client import AsyncOllamaVisionClient
 
 # Configure logging to stderr to avoid interfering with stdio transport
 logging.basicConfig(
@@ -33,23 +35,20 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "https://ollama.com/v1")
 VISION_MODEL = os.getenv("VISION_MODEL", "qwen3-vl:235b-cloud")
 VISION_TEMPERATURE = float(os.getenv("VISION_TEMPERATURE", "0.2"))
 VISION_MAX_TOKENS = int(os.getenv("VISION_MAX_TOKENS", "1000"))
+VISION_MAX_CONCURRENCY = int(os.getenv("VISION_MAX_CONCURRENCY", "8"))
+RESIZE_MAX_DIM = int(os.getenv("RESIZE_MAX_DIM", "1568"))
+VISION_NATIVE_UPLOAD = os.getenv("VISION_NATIVE_UPLOAD", "false").lower() in ("1", "true", "yes")
 
 if not OLLAMA_API_KEY:
     logger.error("OLLAMA_API_KEY environment variable is required")
     raise ValueError("OLLAMA_API_KEY not set")
 
-# Global Ollama client
-ollama_client = OllamaVisionClient(
-    api_key=OLLAMA_API_KEY,
-    base_url=OLLAMA_BASE_URL,
-    model=VISION_MODEL,
-    temperature=VISION_TEMPERATURE,
-    max_tokens=VISION_MAX_TOKENS
-)
+# Bounds in-flight model calls from batch requests (Ollama Cloud rate limits)
+vision_semaphore = asyncio.Semaphore(VISION_MAX_CONCURRENCY)
 
 # Define application context
 class AppContext:
-    def __init__(self, ollama_client: OllamaVisionClient):
+    def __init__(self, ollama_client: AsyncOllamaVisionClient):
         self.ollama_client = ollama_client
 
 # Lifespan management
@@ -57,22 +56,40 @@ class AppContext:
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """Manage application lifecycle"""
     logger.info("Starting MCP Image Validator server...")
-    logger.info(f"Using Ollama Cloud at {OLLAMA_BASE_URL}")
-    logger.info(f"Vision model: {VISION_MODEL}")
+    logger.info("Using Ollama Cloud at %s", OLLAMA_BASE_URL)
+    logger.info("Vision model: %s", VISION_MODEL)
+
+    # Create the client on server start rather than at import time
+    ollama_client = AsyncOllamaVisionClient(
+        api_key=OLLAMA_API_KEY,
+        base_url=OLLAMA_BASE_URL,
+        model=VISION_MODEL,
+        temperature=VISION_TEMPERATURE,
+        max_tokens=VISION_MAX_TOKENS,
+        resize_max_dim=RESIZE_MAX_DIM,
+        native_upload=VISION_NATIVE_UPLOAD
+    )
+
+    # Warm up the TCP + TLS session in the background so the first tool
+    # call reuses it, without delaying the server becoming ready
+    warmup_task = asyncio.create_task(ollama_client.check_connection_async())
     try:
         # Startup
         yield AppContext(ollama_client=ollama_client)
     finally:
         # Shutdown
         logger.info("Shutting down MCP Image Validator server")
+        warmup_task.cancel()
+        await ollama_client.aclose()
 
 # Initialize FastMCP with lifespan
 mcp = FastMCP("Image_Validator_MCP_Server", lifespan=app_lifespan)
 
 # Define the image description tool
 @mcp.tool()
-def describe_image(
+async def describe_image(
     image_path: str,
+    ctx: Context,
     prompt: str | None = None
 ) -> str:
     """
@@ -87,36 +104,49 @@ def describe_image(
     Returns:
         Detailed description of the image
     """
-    logger.info(f"Analyzing image: {image_path}")
+    logger.info("Analyzing image: %s", image_path)
     if prompt:
-        logger.info(f"Custom prompt: {prompt}")
+        logger.info("Custom prompt: %s", prompt)
 
     try:
-        # Validate image path
-        img_path = Path(image_path)
-        if not img_path.exists():
+        # Validate image path with a single stat() call
+        try:
+            st = os.stat(image_path)
+        except PermissionError:
+            error_msg = f"Cannot access image file: {image_path}"
+            logger.error(error_msg)
+            raise PermissionError(error_msg) from None
+        except OSError:
+            # Missing file, a file used as a directory, a symlink loop, ...
             error_msg = f"Image file not found: {image_path}"
             logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
+            raise FileNotFoundError(error_msg) from None
 
-        if not img_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             error_msg = f"Path is not a file: {image_path}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
+        img_path = Path(image_path)
+
         # Generate description
-        description = ollama_client.describe_image(
-            image_path=str(img_path.absolute()),
+        ollama_client = ctx.request_context.lifespan_context.ollama_client
+        description = await ollama_client.describe_image_async(
+            image_path=img_path,
             prompt=prompt
         )
 
-        logger.info(f"Successfully described image: {img_path.name}")
+        logger.info("Successfully described image: %s", img_path.name)
         return description
 
     except FileNotFoundError as e:
         error_msg = f"File not found: {str(e)}"
         logger.error(error_msg)
         raise RuntimeError(error_msg) from e
+    except PermissionError as e:
+        error_msg = f"Permission denied: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from e
     except ValueError as e:
         error_msg = f"Invalid input: {str(e)}"
         logger.error(error_msg)
@@ -127,9 +157,43 @@ def describe_image(
         raise RuntimeError(error_msg) from e
 
 
+# Define the batch image description tool
+@mcp.tool()
+async def describe_images(
+    image_paths: list[str],
+    ctx: Context,
+    prompt: str | None = None
+) -> list[str]:
+    """
+    Analyzes several images concurrently using Qwen3-VL vision model through Ollama Cloud.
+
+    Supports common image formats (JPEG, PNG, GIF, WebP, BMP).
+
+    Args:
+        image_paths: Absolute paths to the image files to analyze
+        prompt: Optional custom prompt applied to every image. If not provided, a default description prompt will be used.
+
+    Returns:
+        Descriptions in the same order as image_paths. Images that could not be analyzed get an "Error: ..." entry instead.
+    """
+    logger.info("Analyzing %d images", len(image_paths))
+
+    async def describe_one(image_path: str) -> str:
+        async with vision_semaphore:
+            return await describe_image(image_path, ctx, prompt)
+
+    results = await asyncio.gather(
+        *(describe_one(image_path) for image_path in image_paths),
+        return_exceptions=True
+    )
+
+    return [
+        f"Error: {result}" if isinstance(result, BaseException) else result
+        for result in results
+    ]
+
+
 # Entry point for running the server
 if __name__ == "__main__":
-    import asyncio
-
     # Run the FastMCP server
     mcp.run()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline tests for MCP Image Validator.
+Cover image handling and the request plumbing against a mocked API,
+so no API key or network access is needed.
+"""
+
+import json
+import sys
+from io import BytesIO
+
+import httpx
+import orjson
+from PIL import Image
+
+from ollama_vision_client import OllamaVisionClient, _OrjsonClient, _sniff_mime_type
+
+# Fix encoding for Windows console
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+def _image_bytes(img: Image.Image, fmt: str, **save_kwargs) -> bytes:
+    output = BytesIO()
+    img.save(output, format=fmt, **save_kwargs)
+    return output.getvalue()
+
+
+def _completion(content: str = "A test image") -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+    }
+
+
+class MockApi:
+    """Minimal stand-in for the OpenAI-compatible endpoints the client uses"""
+
+    def __init__(self, upload_status: int = 200, file_id_status: int = 200, chat_status: int = 200):
+        self.upload_status = upload_status
+        self.file_id_status = file_id_status
+        self.chat_status = chat_status
+        self.requests: list[httpx.Request] = []
+        self.image_urls: list[dict] = []
+        self.deleted: list[str] = []
+        self._uploads = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+
+        if request.method == "POST" and path.endswith("/files"):
+            if self.upload_status != 200:
+                return httpx.Response(self.upload_status, json={"error": {"message": "no uploads"}})
+            self._uploads += 1
+            return httpx.Response(200, json={
+                "id": f"file-{self._uploads}", "object": "file", "bytes": 0,
+                "created_at": 0, "filename": "image", "purpose": "vision",
+                "status": "processed",
+            })
+
+        if request.method == "DELETE" and "/files/" in path:
+            file_id = path.rsplit("/", 1)[1]
+            self.deleted.append(file_id)
+            return httpx.Response(200, json={"id": file_id, "object": "file", "deleted": True})
+
+        if request.method == "POST" and path.endswith("/chat/completions"):
+            image_url = json.loads(request.content)["messages"][0]["content"][1]["image_url"]
+            self.image_urls.append(image_url)
+            if self.chat_status != 200:
+                return httpx.Response(self.chat_status, json={"error": {"message": "max_tokens too large"}})
+            if "file_id" in image_url and self.file_id_status != 200:
+                return httpx.Response(self.file_id_status, json={"error": {"message": "file_id not supported"}})
+            return httpx.Response(200, json=_completion())
+
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    def count(self, method: str, suffix: str) -> int:
+        return sum(
+            1 for r in self.requests
+            if r.method == method and r.url.path.endswith(suffix)
+        )
+
+
+def _client(api: MockApi, **kwargs) -> OllamaVisionClient:
+    client = OllamaVisionClient(
+        api_key="test-key",
+        base_url="http://ollama.test/v1",
+        model="test-model",
+        **kwargs
+    )
+    client.http_client._transport = httpx.MockTransport(api)
+    return client
+
+
+PNG_BYTES = _image_bytes(Image.new('RGB', (8, 8), (200, 30, 30)), 'PNG')
+
+
+def test_sniff_mime_type():
+    """Magic bytes map to MIME types; unknown headers are rejected"""
+    assert _sniff_mime_type(PNG_BYTES[:12]) == 'image/png'
+    assert _sniff_mime_type(_image_bytes(Image.new('RGB', (8, 8)), 'JPEG')[:12]) == 'image/jpeg'
+    assert _sniff_mime_type(_image_bytes(Image.new('RGB', (8, 8)), 'GIF')[:12]) == 'image/gif'
+    assert _sniff_mime_type(_image_bytes(Image.new('RGB', (8, 8)), 'WEBP')[:12]) == 'image/webp'
+    assert _sniff_mime_type(_image_bytes(Image.new('RGB', (8, 8)), 'BMP')[:12]) == 'image/bmp'
+    assert _sniff_mime_type(b'not an image') is None
+
+
+def test_cache_put_evicts_oldest():
+    """The LRU caches drop least recently used entries past their count and byte limits"""
+    client = _client(MockApi())
+    cache = client._encoding_cache
+
+    client._cache_put(cache, ('a', False), 'x' * 40, 2)
+    client._cache_put(cache, ('b', False), 'x' * 40, 2)
+    assert client._cache_get(cache, ('a', False)) is not None  # 'a' is now most recent
+    assert client._cache_put(cache, ('c', False), 'x' * 40, 2) == ['x' * 40]
+    assert list(cache) == [('a', False), ('c', False)]
+
+    # Byte budget: evict until the values fit, never cache oversized values
+    client._cache_put(cache, ('d', False), 'y' * 30, 10, max_bytes=80)
+    assert list(cache) == [('c', False), ('d', False)]
+    client._cache_put(cache, ('e', False), 'z' * 200, 10, max_bytes=80)
+    assert ('e', False) not in cache
+    client.close()
+
+
+def test_resize_flattens_alpha_onto_white():
+    """Transparent areas become white, not black, in the resized JPEG"""
+    client = _client(MockApi(), resize_max_dim=32)
+    data = _image_bytes(Image.new('RGBA', (128, 64), (0, 0, 0, 0)), 'PNG')
+
+    resized = Image.open(BytesIO(client._resize_image(data)))
+    assert resized.format == 'JPEG'
+    assert resized.size == (32, 16)
+    assert resized.convert('L').getextrema()[0] > 245
+    client.close()
+
+
+def test_resize_applies_exif_orientation():
+    """The EXIF Orientation tag is baked into the pixels before re-encoding"""
+    client = _client(MockApi(), resize_max_dim=32)
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90° clockwise
+    data = _image_bytes(Image.new('RGB', (128, 64)), 'JPEG', exif=exif)
+
+    resized = Image.open(BytesIO(client._resize_image(data)))
+    assert resized.size == (16, 32)
+    client.close()
+
+
+def test_orjson_request_body():
+    """JSON bodies are serialized by orjson and still sent as application/json"""
+    payload = {"model": "test-model", "text": "Привет", "n": [1, 2.5, None]}
+    with _OrjsonClient() as http_client:
+        request = http_client.build_request("POST", "http://ollama.test/v1", json=payload)
+    assert request.content == orjson.dumps(payload)
+    assert request.headers["Content-Type"] == "application/json"
+
+    api = MockApi()
+    client = _client(api)
+    assert client.describe_image_bytes(PNG_BYTES, 'image/png') == "A test image"
+    chat = api.requests[-1]
+    assert chat.headers["Content-Type"] == "application/json"
+    assert orjson.loads(chat.content)["model"] == "test-model"
+    client.close()
+
+
+def test_upload_failure_falls_back_to_base64():
+    """An endpoint without /files support gets base64 data URLs from then on"""
+    api = MockApi(upload_status=405)
+    client = _client(api, native_upload=True)
+
+    client.describe_image_bytes(PNG_BYTES, 'image/png', prompt="first")
+    client.describe_image_bytes(PNG_BYTES, 'image/png', prompt="second")
+    assert api.count("POST", "/files") == 1
+    assert [list(url) for url in api.image_urls] == [["url"], ["url"]]
+    assert api.image_urls[0]["url"].startswith("data:image/png;base64,")
+    assert not client._native_upload_available
+    client.close()
+
+
+def test_file_id_rejection_falls_back_to_base64():
+    """A rejected file_id is retried as a data URL and native upload is turned off"""
+    api = MockApi(file_id_status=400)
+    client = _client(api, native_upload=True)
+
+    assert client.describe_image_bytes(PNG_BYTES, 'image/png') == "A test image"
+    assert [list(url) for url in api.image_urls] == [["file_id"], ["url"]]
+    assert not client._native_upload_available
+    assert api.deleted == ["file-1"]
+
+    # Later calls skip the upload entirely
+    client.describe_image_bytes(PNG_BYTES, 'image/png', prompt="again")
+    assert api.count("POST", "/files") == 1
+    assert list(api.image_urls[-1]) == ["url"]
+    client.close()
+
+
+def test_unrelated_bad_request_keeps_native_upload():
+    """A 400 that also fails with base64 is raised without disabling file_id images"""
+    api = MockApi(chat_status=400)
+    client = _client(api, native_upload=True)
+
+    try:
+        client.describe_image_bytes(PNG_BYTES, 'image/png')
+    except RuntimeError as e:
+        assert "max_tokens too large" in str(e)
+    else:
+        raise AssertionError("expected RuntimeError")
+    assert client._native_upload_available
+
+    # The uploaded file stays cached for reuse and is removed on close
+    client.close()
+    assert api.deleted == ["file-1"]
+
+
+def main():
+    tests = [
+        value for name, value in globals().items()
+        if name.startswith("test_") and callable(value)
+    ]
+
+    print("=" * 60)
+    print("MCP Image Validator - Offline Tests")
+    print("=" * 60)
+    print()
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+
+    print()
+    if failed:
+        print(f"❌ Не пройдено тестов: {failed} из {len(tests)}")
+        return 1
+    print(f"✓✓✓ ВСЕ ТЕСТЫ ПРОЙДЕНЫ ({len(tests)}) ✓✓✓")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())